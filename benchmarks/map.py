@@ -1,6 +1,6 @@
 from io import BytesIO
 
-from asv_runner.benchmarks.mark import SkipNotImplemented, skip_benchmark
+from asv_runner.benchmarks.mark import skip_benchmark
 from matplotlib.figure import Figure
 
 import astropy.units as u
@@ -14,19 +14,24 @@ class Creation:
     params = ['AIA_171_IMAGE', 'HMI_LOS_IMAGE']
     param_names = ['name']
 
-    def setup(self, name):
-        self.filename = getattr(sunpy.data.sample, name)
+    def setup_cache(self):
+        # Resolve the sample-data paths once, instead of paying the attribute
+        # lookup (and possible download) in every repetition's setup
+        return {name: getattr(sunpy.data.sample, name) for name in self.params}
+
+    def setup(self, paths, name):
+        self.filename = paths[name]
 
-    def time_create_map(self, name):
+    def time_create_map(self, paths, name):
         sunpy.map.Map(self.filename)
 
     # Skipped due to a bug in pympler.asizeof
     # https://github.com/pympler/pympler/issues/151
     @skip_benchmark
-    def mem_create_map(self, name):
+    def mem_create_map(self, paths, name):
         return sunpy.map.Map(self.filename)
 
-    def peakmem_create_map(self, name):
+    def peakmem_create_map(self, paths, name):
         sunpy.map.Map(self.filename)
 
 
@@ -43,16 +48,32 @@ class Resample:
 
 
 class Rotate:
-    params = (['scipy', 'scikit-image', 'opencv'], range(0, 6))
+    # These orders are supported by all three methods
+    params = (['opencv', 'scikit-image', 'scipy'], [0, 1, 3])
     param_names = ['method', 'order']
 
     def setup_cache(self):
         aiamap = sunpy.map.Map(sunpy.data.sample.AIA_171_IMAGE)
         return aiamap
 
-    def setup(self, aiamap, method, order):
-        if method == 'opencv' and order not in {0, 1, 3}:
-            raise SkipNotImplemented
+    def time_rotate(self, aiamap, method, order):
+        aiamap.rotate(30*u.deg, method=method, order=order)
+
+    def time_rotate_trim_zero_border(self, aiamap, method, order):
+        aiamap.rotate(30*u.deg, method=method, order=order, trim_zero_border=True)
+
+    def peakmem_rotate(self, aiamap, method, order):
+        aiamap.rotate(30*u.deg, method=method, order=order)
+
+
+class RotateHighOrder:
+    # These orders are not supported by the opencv method
+    params = (['scikit-image', 'scipy'], [2, 4, 5])
+    param_names = ['method', 'order']
+
+    def setup_cache(self):
+        aiamap = sunpy.map.Map(sunpy.data.sample.AIA_171_IMAGE)
+        return aiamap
 
     def time_rotate(self, aiamap, method, order):
         aiamap.rotate(30*u.deg, method=method, order=order)
@@ -72,9 +93,17 @@ class Reproject:
     def time_reproject_to(self, maps, algorithm):
         maps[1].reproject_to(maps[0].wcs, algorithm=algorithm)
 
+    def time_reproject_to_blocked(self, maps, algorithm):
+        # Reprojecting in tiles keeps the working set cache-sized and also
+        # bounds the peak memory of the coordinate-transform intermediates
+        maps[1].reproject_to(maps[0].wcs, algorithm=algorithm, block_size=(512, 512))
+
     def peakmem_reproject_to(self, maps, algorithm):
         maps[1].reproject_to(maps[0].wcs, algorithm=algorithm)
 
+    def peakmem_reproject_to_blocked(self, maps, algorithm):
+        maps[1].reproject_to(maps[0].wcs, algorithm=algorithm, block_size=(512, 512))
+
     def time_reproject_to_plus_diffrot(self, maps, algorithm):
         with propagate_with_solar_surface():
             maps[1].reproject_to(maps[0].wcs, algorithm=algorithm)
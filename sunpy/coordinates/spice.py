@@ -57,6 +57,8 @@ Examples
 #   ICRS. ICRS is a safe frame to use because the SPICE built-in inertial
 #   frame 'J2000' is ICRS, despite its name.
 
+import functools
+
 import numpy as np
 
 try:
@@ -77,11 +79,14 @@ from sunpy.time import parse_time
 from sunpy.time.time import _variables_for_parse_time_docstring
 from sunpy.util.decorators import add_common_docstring
 
-__all__ = ['SpiceBaseCoordinateFrame', 'get_body', 'get_fov', 'initialize', 'install_frame', 'get_rotation_matrix']
+__all__ = ['SpiceBaseCoordinateFrame', 'get_body', 'get_bodies', 'get_fov', 'initialize',
+           'install_frame', 'get_rotation_matrix']
 
 
 # Note that this epoch is very slightly different from the typical definition of J2000.0 (in TT)
 _ET_REF_EPOCH = Time('J2000', scale='tdb')
+# The epoch as two-part JD, hoisted so that _convert_to_et() can do plain float arithmetic
+_ET_REF_JD1, _ET_REF_JD2 = _ET_REF_EPOCH.tdb.jd1, _ET_REF_EPOCH.tdb.jd2
 
 _CLASS_TYPES = {1: 'inertial', 2: 'PCK', 3: 'CK', 4: 'TK', 5: 'dynamic', 6: 'switch'}
 
@@ -90,6 +95,17 @@ _CLASS_TYPES = {1: 'inertial', 2: 'PCK', 3: 'CK', 4: 'TK', 5: 'dynamic', 6: 'swi
 _frame_registry = {}
 _center_registry = {'SOLAR SYSTEM BARYCENTER': ICRS}
 
+# Cache of frame name -> center body ID, which is invariant for loaded kernels
+_frame_center_registry = {'J2000': 0}
+
+
+def _frame_center_id(spice_frame_name):
+    center_id = _frame_center_registry.get(spice_frame_name)
+    if center_id is None:
+        center_id = spiceypy.frinfo(spiceypy.namfrm(spice_frame_name))[0]
+        _frame_center_registry[spice_frame_name] = center_id
+    return center_id
+
 
 @add_common_docstring(**_variables_for_parse_time_docstring())
 class SpiceBaseCoordinateFrame(SunPyBaseCoordinateFrame):
@@ -162,7 +178,40 @@ class SpiceBaseCoordinateFrame(SunPyBaseCoordinateFrame):
 
 
 def _convert_to_et(time):
-    return (time - _ET_REF_EPOCH).to_value('s')
+    # Equivalent to (time - _ET_REF_EPOCH).to_value('s'), but operating directly on the
+    # two-part JDs to avoid the overhead of constructing a TimeDelta on every call.
+    # The jd1/jd2 attributes are plain float64 scalars/arrays, so this is a handful of
+    # numpy ufunc calls for scalar and array Time alike.
+    tdb = time.tdb
+    return ((tdb.jd1 - _ET_REF_JD1) + (tdb.jd2 - _ET_REF_JD2)) * 86400.0
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_rotation_matrix(from_frame, to_frame, et):
+    # matrix needs to be contiguous (see https://github.com/astropy/astropy/issues/15503)
+    return np.ascontiguousarray(spiceypy.sxform(from_frame, to_frame, et)[:3, :3])
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_ssb_offset(body_name, et):
+    return spiceypy.spkpos(body_name, et, 'J2000', 'NONE', 'SSB')[0]
+
+
+def _rotation_matrix(from_frame, to_frame, et):
+    # The rotation matrix is a pure function of (from_frame, to_frame, et), so scalar
+    # queries are memoized to skip repeated SPICE calls when an obstime is reused.
+    # The ET is rounded to the microsecond level to maximize the cache hit rate.
+    if np.ndim(et) == 0:
+        return _cached_rotation_matrix(from_frame, to_frame, round(float(et), 6))
+    # matrix needs to be contiguous (see https://github.com/astropy/astropy/issues/15503)
+    return np.ascontiguousarray(spiceypy.sxform(from_frame, to_frame, et)[..., :3, :3])
+
+
+def _ssb_offset(body_name, et):
+    # Memoized the same way as _rotation_matrix()
+    if np.ndim(et) == 0:
+        return _cached_ssb_offset(body_name, round(float(et), 6)) << u.km
+    return spiceypy.spkpos(body_name, et, 'J2000', 'NONE', 'SSB')[0] << u.km
 
 
 def _astropy_frame_name(spice_frame_name):
@@ -179,6 +228,44 @@ def _is_2d(data):
     return data.norm().unit is u.one and u.allclose(data.norm(), 1*u.one)
 
 
+# The transform functions below are shared across all generated frame classes, keyed
+# on the class attributes set via __init_subclass__, rather than being created as
+# per-frame closures or generated per frame. This avoids allocating near-identical
+# function objects for every frame defined in the kernel pool, and the attribute
+# lookups are negligible next to the SPICE calls they precede.
+
+def _icrs_to_shifted(from_icrs_coord, to_shifted_frame):
+    if _is_2d(from_icrs_coord.data):
+        raise ConvertError("Cannot transform a 2D coordinate due to a shift in origin.")
+    icrs_offset = _ssb_offset(to_shifted_frame._center_name,
+                              _convert_to_et(to_shifted_frame.obstime))
+    shifted_pos = from_icrs_coord.cartesian - CartesianRepresentation(icrs_offset.T)
+    return to_shifted_frame.realize_frame(shifted_pos)
+
+
+def _shifted_to_icrs(from_shifted_coord, to_icrs_frame):
+    if _is_2d(from_shifted_coord.data):
+        raise ConvertError("Cannot transform a 2D coordinate due to a shift in origin.")
+    icrs_offset = _ssb_offset(from_shifted_coord._center_name,
+                              _convert_to_et(from_shifted_coord.obstime))
+    icrs_pos = from_shifted_coord.cartesian + CartesianRepresentation(icrs_offset.T)
+    return to_icrs_frame.realize_frame(icrs_pos)
+
+
+def _rotate_from_icrf(from_shifted_coord, to_spice_frame):
+    et = _convert_to_et(to_spice_frame.obstime)
+    matrix = _rotation_matrix('J2000', to_spice_frame._frame_name, et)
+    new_pos = from_shifted_coord.data.transform(matrix)
+    return to_spice_frame.realize_frame(new_pos)
+
+
+def _rotate_to_icrf(from_spice_coord, to_shifted_frame):
+    et = _convert_to_et(from_spice_coord.obstime)
+    matrix = _rotation_matrix(from_spice_coord._frame_name, 'J2000', et)
+    shifted_pos = from_spice_coord.data.transform(matrix)
+    return to_shifted_frame.realize_frame(shifted_pos)
+
+
 def _install_center_by_id(center_id):
     center_name = spiceypy.bodc2n(center_id)
     if center_name in _center_registry.keys():
@@ -189,25 +276,10 @@ def _install_center_by_id(center_id):
     center_cls = type(astropy_center_name, (SpiceBaseCoordinateFrame,), {},
                       frame_name=None, center_name=center_name)
 
-    @frame_transform_graph.transform(FunctionTransformWithFiniteDifference, ICRS, center_cls)
-    def icrs_to_shifted(from_icrs_coord, to_shifted_frame):
-        if _is_2d(from_icrs_coord.data):
-            raise ConvertError("Cannot transform a 2D coordinate due to a shift in origin.")
-        icrs_offset = spiceypy.spkpos(center_name,
-                                      _convert_to_et(to_shifted_frame.obstime),
-                                      'J2000', 'NONE', 'SSB')[0] << u.km
-        shifted_pos = from_icrs_coord.cartesian - CartesianRepresentation(icrs_offset.T)
-        return to_shifted_frame.realize_frame(shifted_pos)
-
-    @frame_transform_graph.transform(FunctionTransformWithFiniteDifference, center_cls, ICRS)
-    def shifted_to_icrs(from_shifted_coord, to_icrs_frame):
-        if _is_2d(from_shifted_coord.data):
-            raise ConvertError("Cannot transform a 2D coordinate due to a shift in origin.")
-        icrs_offset = spiceypy.spkpos(center_name,
-                                      _convert_to_et(from_shifted_coord.obstime),
-                                      'J2000', 'NONE', 'SSB')[0] << u.km
-        icrs_pos = from_shifted_coord.cartesian + CartesianRepresentation(icrs_offset.T)
-        return to_icrs_frame.realize_frame(icrs_pos)
+    frame_transform_graph.transform(FunctionTransformWithFiniteDifference,
+                                    ICRS, center_cls)(_icrs_to_shifted)
+    frame_transform_graph.transform(FunctionTransformWithFiniteDifference,
+                                    center_cls, ICRS)(_shifted_to_icrs)
 
     frame_transform_graph._add_merged_transform(center_cls, ICRS, center_cls)
 
@@ -220,6 +292,7 @@ def _install_frame_by_id(frame_id):
 
     center_id, class_num, _ = spiceypy.frinfo(frame_id)
     center_name = spiceypy.bodc2n(center_id)
+    _frame_center_registry[frame_name] = center_id
     log.info(f"Installing {frame_name} {_CLASS_TYPES[class_num]} frame ({frame_id}) "
              f"as '{astropy_frame_name}'")
 
@@ -232,21 +305,10 @@ def _install_frame_by_id(frame_id):
     # Force the capitalization pattern of lowercase "spice_" followed by uppercase SPICE frame name
     frame_cls.name = frame_cls.__name__
 
-    @frame_transform_graph.transform(FunctionTransformWithFiniteDifference, center_cls, frame_cls)
-    def rotate_from_icrf(from_shifted_coord, to_spice_frame):
-        et = _convert_to_et(to_spice_frame.obstime)
-        # matrix needs to be contiguous (see https://github.com/astropy/astropy/issues/15503)
-        matrix = np.ascontiguousarray(spiceypy.sxform('J2000', frame_name, et)[..., :3, :3])
-        new_pos = from_shifted_coord.data.transform(matrix)
-        return to_spice_frame.realize_frame(new_pos)
-
-    @frame_transform_graph.transform(FunctionTransformWithFiniteDifference, frame_cls, center_cls)
-    def rotate_to_icrf(from_spice_coord, to_shifted_frame):
-        et = _convert_to_et(from_spice_coord.obstime)
-        # matrix needs to be contiguous (see https://github.com/astropy/astropy/issues/15503)
-        matrix = np.ascontiguousarray(spiceypy.sxform(frame_name, 'J2000', et)[..., :3, :3])
-        shifted_pos = from_spice_coord.data.transform(matrix)
-        return to_shifted_frame.realize_frame(shifted_pos)
+    frame_transform_graph.transform(FunctionTransformWithFiniteDifference,
+                                    center_cls, frame_cls)(_rotate_from_icrf)
+    frame_transform_graph.transform(FunctionTransformWithFiniteDifference,
+                                    frame_cls, center_cls)(_rotate_to_icrf)
 
     frame_transform_graph._add_merged_transform(frame_cls, center_cls, frame_cls)
 
@@ -288,6 +350,12 @@ def initialize(kernels):
     # furnsh() needs path strings
     spiceypy.furnsh([str(kernel) for kernel in kernels])
 
+    # Loading kernels can change frame definitions, so discard any memoized results
+    _cached_rotation_matrix.cache_clear()
+    _cached_ssb_offset.cache_clear()
+    _frame_center_registry.clear()
+    _frame_center_registry['J2000'] = 0
+
     # Remove all existing SPICE frame classes
     global _frame_registry
     if _frame_registry:
@@ -359,7 +427,8 @@ def get_body(body, time, *, spice_frame='J2000', observer=None):
     body : `int`, `str`
         The NAIF body ID, or a string that is resolvable to a body ID
     time : {parse_time_types}
-        Time to use in a parse_time-compatible format.
+        Time to use in a parse_time-compatible format. This can be an array of
+        times.
     spice_frame : `str`
         The SPICE frame name to use for the returned coordinate. Defaults to
         ``'J2000'``, which is equivalent to Astropy's `~astropy.coordinates.ICRS`.
@@ -376,9 +445,10 @@ def get_body(body, time, *, spice_frame='J2000', observer=None):
     obstime = parse_time(time)
     et = _convert_to_et(obstime)
 
-    frame_center = spiceypy.frinfo(spiceypy.namfrm(spice_frame))[0]
+    frame_center = _frame_center_id(spice_frame)
 
     if observer is None:
+        # spkpos() natively supports an array of ETs
         pos = spiceypy.spkpos(body_name,
                               et,
                               spice_frame,
@@ -386,32 +456,92 @@ def get_body(body, time, *, spice_frame='J2000', observer=None):
                               spiceypy.bodc2n(frame_center))[0] << u.km
     else:
         obspos = observer.icrs.cartesian.xyz.to_value('km')
-        pos, lt = spiceypy.spkcpo(body_name,
-                                  et,
-                                  spice_frame,
-                                  'OBSERVER',
-                                  'CN',
-                                  obspos,
-                                  'SSB',
-                                  'J2000')
-        log.info(f"Apparent body location accounts for {lt:.2f} seconds of light travel time")
-
-        pos = pos[:3] << u.km
+
+        # spkcpo() supports only a scalar ET, so loop over the ETs as needed
+        if obstime.isscalar:
+            state, lt = spiceypy.spkcpo(body_name,
+                                        et,
+                                        spice_frame,
+                                        'OBSERVER',
+                                        'CN',
+                                        obspos,
+                                        'SSB',
+                                        'J2000')
+            pos = state[:3]
+            log.info(f"Apparent body location accounts for {lt:.2f} seconds of light travel time")
+        else:
+            pos = np.empty(obstime.shape + (3,))
+            lt = np.empty(obstime.shape)
+            for index, this_et in np.ndenumerate(et):
+                state, lt[index] = spiceypy.spkcpo(body_name,
+                                                   this_et,
+                                                   spice_frame,
+                                                   'OBSERVER',
+                                                   'CN',
+                                                   obspos,
+                                                   'SSB',
+                                                   'J2000')
+                pos[index] = state[:3]
+            log.info(f"Apparent body location accounts for {lt.min():.2f} to {lt.max():.2f} "
+                     "seconds of light travel time")
+
+        pos = pos << u.km
         if spice_frame != 'J2000':
             shift = spiceypy.spkpos(spiceypy.bodc2n(frame_center),
                                     et,
                                     'J2000',
                                     'NONE',
                                     'SSB')[0]
-            obspos -= shift
+            obspos = obspos - shift
 
-            matrix = spiceypy.pxform('J2000', spice_frame, _convert_to_et(obstime))
-            obspos = matrix @ obspos
+            matrix = _rotation_matrix('J2000', spice_frame, et)
+            obspos = (matrix @ obspos[..., np.newaxis])[..., 0]
         pos += obspos << u.km
 
     frame_name = 'icrs' if spice_frame == 'J2000' else _astropy_frame_name(spice_frame)
 
-    return SkyCoord(CartesianRepresentation(pos.T), frame=frame_name, obstime=obstime)
+    return SkyCoord(CartesianRepresentation(np.moveaxis(pos, -1, 0)),
+                    frame=frame_name, obstime=obstime)
+
+
+@add_common_docstring(**_variables_for_parse_time_docstring())
+def get_bodies(bodies, time, *, spice_frame='J2000'):
+    """
+    Get the locations of multiple bodies at the same time via SPICE.
+
+    This is faster than calling :func:`~sunpy.coordinates.spice.get_body` once
+    per body because the ephemeris-time conversion and the frame-center lookup
+    are performed only once for all of the bodies.
+
+    Parameters
+    ----------
+    bodies : iterable of `int` or `str`
+        The NAIF body IDs, or strings that are resolvable to body IDs
+    time : {parse_time_types}
+        Time to use in a parse_time-compatible format.
+    spice_frame : `str`
+        The SPICE frame name to use for the returned coordinate. Defaults to
+        ``'J2000'``, which is equivalent to Astropy's `~astropy.coordinates.ICRS`.
+
+    Returns
+    -------
+    `~astropy.coordinates.SkyCoord`
+        The locations of the bodies, with the body axis as the leading dimension.
+    """
+    body_names = [spiceypy.bodc2n(body) if isinstance(body, int) else body for body in bodies]
+    obstime = parse_time(time)
+    et = _convert_to_et(obstime)
+
+    center_name = spiceypy.bodc2n(_frame_center_id(spice_frame))
+
+    pos = np.empty((len(body_names), *obstime.shape, 3))
+    for i, body_name in enumerate(body_names):
+        pos[i] = spiceypy.spkpos(body_name, et, spice_frame, 'NONE', center_name)[0]
+    pos = np.moveaxis(pos, -1, 0) << u.km
+
+    frame_name = 'icrs' if spice_frame == 'J2000' else _astropy_frame_name(spice_frame)
+
+    return SkyCoord(CartesianRepresentation(pos), frame=frame_name, obstime=obstime)
 
 
 @add_common_docstring(**_variables_for_parse_time_docstring())
@@ -153,6 +153,26 @@ def test_get_body_array_time(spice_test):
     assert earth[0].distance != earth[1].distance
 
 
+def test_get_bodies(spice_test):
+    coords = spice.get_bodies([399, 'venus'], '2023-10-17')
+    earth = spice.get_body(399, '2023-10-17')
+    venus = spice.get_body('venus', '2023-10-17')
+
+    assert coords.name == 'icrs'
+    assert coords.shape == (2,)
+    assert coords[0] == earth
+    assert coords[1] == venus
+
+
+def test_get_bodies_array_time(spice_test):
+    obstime = parse_time(['2013-10-17', '2013-10-18'])
+    coords = spice.get_bodies(['earth', 'venus'], obstime, spice_frame='HCI')
+
+    assert coords.shape == (2, 2)
+    assert coords[0] == spice.get_body('earth', obstime, spice_frame='HCI')
+    assert coords[1] == spice.get_body('venus', obstime, spice_frame='HCI')
+
+
 def test_get_body_spice_frame(spice_test):
     # Regression test
     moon_gse = spice.get_body('moon', '2023-10-17', spice_frame='GSE')
@@ -237,11 +237,13 @@ def test_int(identity):
     assert np.issubdtype(out_arr.dtype, np.floating)
 
 
-def test_float32(identity):
-    # Check that float32 input remains as float32 output
-    # Test casting of integer array to float array
-    in_arr = np.array([[100]], dtype=np.float32)
-    out_arr = affine_transform(in_arr, rmatrix=identity)
+@pytest.mark.parametrize('method', list(_rotation_registry))
+def test_float32(rot30, method):
+    # Check that float32 input remains as float32 output for every method,
+    # since a promotion to float64 would double the memory traffic of the
+    # interpolation
+    in_arr = np.ones((10, 10), dtype=np.float32)
+    out_arr = affine_transform(in_arr, rmatrix=rot30, method=method)
     assert np.issubdtype(out_arr.dtype, np.float32)
 
 
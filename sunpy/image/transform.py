@@ -218,16 +218,23 @@ def add_rotation_function(name, *, allowed_orders,
                 sizes = [1, 1, 5, 5, 7, 7]
 
                 t = time.perf_counter()
-                try:
-                    # If OpenCV is installed, its convolution function is much faster
-                    import cv2
-                    expanded_nans = cv2.filter2D(isnan.astype(float), -1,
-                                                 np.ones((sizes[order], sizes[order])),
-                                                 borderType=cv2.BORDER_CONSTANT)
-                except ImportError:
-                    expanded_nans = convolve2d(isnan.astype(float),
-                                               np.ones((sizes[order], sizes[order])),
-                                               mode='same')
+                # The mask is convolved in float32 because its values are small
+                # integer counts, and the lower precision halves the memory traffic
+                if sizes[order] == 1:
+                    # Convolution with a 1x1 kernel is an identity operation, so skip it
+                    expanded_nans = isnan.astype(np.float32)
+                else:
+                    # The kernel must also be float32 or the convolution output
+                    # promotes back to float64
+                    kernel = np.ones((sizes[order], sizes[order]), dtype=np.float32)
+                    try:
+                        # If OpenCV is installed, its convolution function is much faster
+                        import cv2
+                        expanded_nans = cv2.filter2D(isnan.astype(np.float32), -1, kernel,
+                                                     borderType=cv2.BORDER_CONSTANT)
+                    except ImportError:
+                        expanded_nans = convolve2d(isnan.astype(np.float32), kernel,
+                                                   mode='same')
                 log.debug(f"{name} expanding image NaNs: {time.perf_counter() - t:.3f} s")
 
                 t = time.perf_counter()
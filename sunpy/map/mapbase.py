@@ -1762,7 +1762,8 @@ class GenericMap(NDData):
     @add_common_docstring(rotation_function_names=_rotation_function_names)
     @u.quantity_input
     def rotate(self, angle: u.deg = None, rmatrix=None, order=3, scale=1.0,
-               recenter=False, missing=np.nan, *, method='scipy', clip=True):
+               recenter=False, missing=np.nan, *, method='scipy', clip=True,
+               trim_zero_border=False):
         """
         Returns a new rotated and rescaled map.
 
@@ -1798,6 +1799,12 @@ class GenericMap(NDData):
             If `True`, clips the pixel values of the output image to the range of the
             input image (including the value of ``missing``, if used).
             Defaults to `True`.
+        trim_zero_border : `bool`, optional
+            If `True`, crop the map to the bounding box of its non-zero data
+            before rotating, which avoids spending interpolation time on an
+            all-zero border. The returned map covers only the rotated bounding
+            box of the retained data.
+            Defaults to `False`.
 
         Returns
         -------
@@ -1842,6 +1849,22 @@ class GenericMap(NDData):
 
         method = _get_transform_method(method)
 
+        if trim_zero_border:
+            # Interpolating an all-zero border is wasted work, so crop the map to the
+            # bounding box of its non-zero data before rotating. Cropping through
+            # submap() keeps the WCS consistent, so the rotation bookkeeping below
+            # needs no adjustment.
+            nonzero = np.argwhere(self.data != 0)
+            if nonzero.size > 0:
+                bottom_left = nonzero.min(axis=0)
+                top_right = nonzero.max(axis=0)
+                if np.any(bottom_left > 0) or np.any(top_right < np.array(self.data.shape) - 1):
+                    cropped = self.submap(np.flipud(bottom_left) * u.pix,
+                                          top_right=np.flipud(top_right) * u.pix)
+                    return cropped.rotate(angle=angle, rmatrix=rmatrix, order=order,
+                                          scale=scale, recenter=recenter, missing=missing,
+                                          method=method, clip=clip)
+
         # The FITS-WCS transform is by definition defined around the
         # reference coordinate in the header.
         lon, lat = self._get_lon_lat(self.reference_coordinate.frame)
@@ -3100,6 +3123,13 @@ class GenericMap(NDData):
         if target_wcs.array_shape is not None:
             reproject_args.setdefault('shape_out', target_wcs.array_shape)
 
+        # reproject otherwise allocates a float64 output array, so request a float32
+        # output for float32 data to halve the memory traffic of the reprojection
+        if self.data.dtype == np.float32 and 'output_array' not in reproject_args \
+                and 'shape_out' in reproject_args:
+            reproject_args['output_array'] = np.empty(reproject_args['shape_out'],
+                                                      dtype=np.float32)
+
         # Reproject the array
         output_array = func(self, target_wcs, return_footprint=return_footprint, **reproject_args)
         if return_footprint:
@@ -1242,6 +1242,28 @@ def test_rotate_rmatrix_angle(generic_map):
         generic_map.rotate(angle=5*u.deg, rmatrix=np.array([[1, 0], [0, 1]]))
 
 
+def test_rotate_trim_zero_border(aia171_test_map):
+    # Surround the map with a zero border that the trim should discard
+    padded_data = np.pad(aia171_test_map.data, 10)
+    padded_meta = aia171_test_map.meta.copy()
+    padded_meta['crpix1'] += 10
+    padded_meta['crpix2'] += 10
+    padded_map = sunpy.map.Map(padded_data, padded_meta)
+
+    rotated_map = aia171_test_map.rotate(20 * u.deg, order=0)
+    trimmed_map = padded_map.rotate(20 * u.deg, order=0, trim_zero_border=True)
+
+    # Trimming the zero border should reproduce the rotation of the unpadded map
+    assert trimmed_map.data.shape == rotated_map.data.shape
+    np.testing.assert_allclose(trimmed_map.data, rotated_map.data, equal_nan=True)
+    assert_quantity_allclose(u.Quantity(trimmed_map.reference_pixel),
+                             u.Quantity(rotated_map.reference_pixel))
+
+    # A map with no zero border should be rotated unchanged
+    untrimmed_map = aia171_test_map.rotate(20 * u.deg, order=0, trim_zero_border=True)
+    np.testing.assert_allclose(untrimmed_map.data, rotated_map.data, equal_nan=True)
+
+
 def test_rotate_invalid_order(generic_map):
     with pytest.raises(ValueError, match="Order must be between 0 and 5."):
         generic_map.rotate(order=6)
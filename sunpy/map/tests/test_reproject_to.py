@@ -119,6 +119,14 @@ def test_return_footprint(aia171_test_map, hpc_header):
         assert isinstance(return_with_footprint[1], np.ndarray)
 
 
+@pytest.mark.parametrize('algorithm', ['interpolation', 'adaptive', 'exact'])
+def test_float32_preserved(aia171_test_map, hpc_header, algorithm):
+    float32_map = sunpy.map.Map(aia171_test_map.data.astype(np.float32),
+                                aia171_test_map.meta)
+    output_map = float32_map.reproject_to(hpc_header, algorithm=algorithm)
+    assert output_map.data.dtype == np.float32
+
+
 def test_invalid_inputs(aia171_test_map, hpc_header):
     with pytest.raises(ValueError, match="The specified algorithm must be one of"):
         aia171_test_map.reproject_to(hpc_header, algorithm='something')
@@ -1,6 +1,8 @@
 """
 Classes and helper functions for VSO responses.
 """
+import operator
+from itertools import chain
 from collections import defaultdict
 from collections.abc import Mapping
 
@@ -28,8 +30,9 @@ def iter_sort_response(response):
 
     Returns
     -------
-    `list`
-        Sorted record items w.r.t. their start time.
+    iterator
+        Record items sorted w.r.t. their start time, with those without a
+        start time at the end.
     """
     has_time_recs = list()
     has_notime_recs = list()
@@ -44,9 +47,22 @@ def iter_sort_response(response):
                 has_time_recs.append(rec)
             else:
                 has_notime_recs.append(rec)
-    has_time_recs = sorted(has_time_recs, key=lambda x: x.time.start)
-    all_recs = has_time_recs + has_notime_recs
-    return all_recs
+    # VSO start times are fixed-width timestamp strings, which sort chronologically
+    # as plain strings, so the extracted keys can be sorted at C level by numpy
+    # instead of comparing records through Python-level key callbacks
+    get_start = operator.attrgetter('time.start')
+    keys = [get_start(rec) for rec in has_time_recs]
+    if all(isinstance(key, str) for key in keys):
+        # A stable sort preserves the response order of records that share a
+        # start time, matching the behavior of sorted()
+        has_time_recs = [has_time_recs[i] for i in np.argsort(keys, kind='stable')]
+    else:
+        # For unusual start-time types, decorate-sort-undecorate so the keys are
+        # extracted O(N) times rather than once per comparison; the index breaks
+        # ties to keep the sort stable
+        keyed = sorted(zip(keys, range(len(keys)), has_time_recs))
+        has_time_recs = [rec for _, _, rec in keyed]
+    return chain(has_time_recs, has_notime_recs)
 
 
 class VSOQueryResponseTable(QueryResponseTable):
@@ -66,7 +82,11 @@ class VSOQueryResponseTable(QueryResponseTable):
         else:
             records = response
 
-        data = []
+        # Accumulate the records into columns: astropy tables are stored
+        # column-wise, so building each column in one pass and constructing the
+        # table once is much faster than per-row construction
+        columns = {}
+        nrows = 0
         for record in records:
             row = defaultdict(lambda: None)
             for key, value in serialize_object(record).items():
@@ -95,8 +115,18 @@ class VSOQueryResponseTable(QueryResponseTable):
                         else:
                             key_template = f"{key.capitalize()} {subkey.capitalize()}"
                         row[key_template] = subvalue
-            data.append(row)
-        data = cls(data, client=client)
+            for key, value in row.items():
+                column = columns.get(key)
+                if column is None:
+                    # Pad a column first seen in this record with leading Nones
+                    column = columns[key] = [None] * nrows
+                column.append(value)
+            nrows += 1
+            # Pad any columns missing from this record
+            for column in columns.values():
+                if len(column) < nrows:
+                    column.append(None)
+        data = cls(columns, client=client)
         # Parse times
         for col in data.colnames:
             if col.endswith('Time'):
@@ -1,3 +1,4 @@
+from typing import Any, NamedTuple
 from functools import partial
 from xml.etree import ElementTree
 from urllib.error import URLError, HTTPError
@@ -36,6 +37,39 @@ def check_vso_alive():
         pytest.xfail("No working VSO links found.")
 
 
+class QRTime(NamedTuple):
+    start: Any = None
+    end: Any = None
+
+
+class QRRec(NamedTuple):
+    # A slotted record means the attribute chains walked when building tables
+    # (e.g., record.time.start) are C-level reads instead of MockObject's
+    # __getattr__ dict lookups, which matters for large mocked responses.
+    size: int = 0
+    time: QRTime = QRTime()
+    source: str = 'SOHO'
+    instrument: str = 'aia'
+    provider: str = 'SunPy'
+    extent: Any = None
+    fileid: str = 'spam'
+
+    def items(self):
+        # zeep's serialize_object() passes non-zeep objects through untouched,
+        # so provide the mapping interface that from_zeep_response() expects,
+        # with nested namedtuples rendered as dicts
+        return {key: value._asdict() if hasattr(value, '_asdict') else value
+                for key, value in self._asdict().items()}.items()
+
+
+class QRRecordList(NamedTuple):
+    recorditem: list
+
+
+class QRProviderItem(NamedTuple):
+    record: QRRecordList
+
+
 class MockQRRecord:
     """
     Used to test sunpy.net.vso.QueryResponse.build_table(...)
@@ -50,13 +84,12 @@ class MockQRRecord:
         extent=None,
         fileid="spam"
     ):
-        return MockObject(size=size,
-                          time=MockObject(start=start_time, end=end_time),
-                          source=source,
-                          instrument=instrument,
-                          provider="SunPy",
-                          extent=extent,
-                          fileid=fileid)
+        return QRRec(size=size,
+                     time=QRTime(start=start_time, end=end_time),
+                     source=source,
+                     instrument=instrument,
+                     extent=extent,
+                     fileid=fileid)
 
 
 class MockQRResponse:
@@ -73,7 +106,7 @@ class MockQRResponse:
         self.provideritem = list()
 
         if records is not None:
-            self.provideritem = [MockObject(record=MockObject(recorditem=list(records)))]
+            self.provideritem = [QRProviderItem(record=QRRecordList(recorditem=list(records)))]
 
         if errors is not None:
             self.provideritem.extend([MockObject(error=err) for err in errors])
@@ -76,6 +76,10 @@ TIME_FORMAT_LIST = [
 
 _ONE_DAY_TIMEDELTA = TimeDelta(1 * u.day)
 
+# Fast path for the most common time-string shape (e.g., VSO response records),
+# compiled once so that convert_time_str() can skip the scan of TIME_FORMAT_LIST
+_COMMON_TIME_RE = re.compile(r"\d{4}([/-])\d{2}\1\d{2}T\d{2}:\d{2}:\d{2}(\.\d+)?$")
+
 
 def is_time_equal(t1, t2):
     """
@@ -229,6 +233,19 @@ def convert_time_str(time_string, **kwargs):
         if 'TAI' in first_item:
             kwargs['scale'] = 'tai'
 
+        # Handle "YYYY/MM/DDTHH:MM:SS[.ffffff]" (and the dash variant) directly as
+        # ISOT, which skips the format-list scan and the much slower strptime
+        if kwargs.get('format') in (None, 'isot') and _COMMON_TIME_RE.match(first_item):
+            isot_kwargs = {key: value for key, value in kwargs.items() if key != 'format'}
+            try:
+                if is_single_string:
+                    return Time(time_string.replace('/', '-'), format='isot', **isot_kwargs)
+                return Time([item.replace('/', '-') for item in time_string],
+                            format='isot', **isot_kwargs)
+            except ValueError:
+                # Fall back to the general handling (e.g., for an hour of 24)
+                pass
+
         for time_format in TIME_FORMAT_LIST:
             try:
                 try: